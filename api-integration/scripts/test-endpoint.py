@@ -21,15 +21,64 @@ Examples:
     python test-endpoint.py --url "https://api.example.com/users" \
         --method GET \
         --headers '{"Authorization": "Bearer your-token"}'
+    
+    # Repeat the request 20 times over one keep-alive connection
+    python test-endpoint.py --url "https://api.example.com/users" --repeat 20
+    
+    # Send 1000 requests, 50 in flight at a time (requires aiohttp)
+    python test-endpoint.py --url "https://api.example.com/users" \
+        --repeat 1000 --concurrency 50
 """
 
 import argparse
+import asyncio
+import functools
 import json
+import socket
 import sys
-from typing import Optional, Dict
+import time
+from collections import Counter
+from typing import Optional, Dict, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+# Shared session so consecutive calls to the same host reuse the TCP/TLS connection
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Response bodies are read in chunks of this size, up to --max-body-bytes
+CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+
+# Resolved addresses are kept for up to DNS_CACHE_TTL seconds
+DNS_CACHE_TTL = 300
+_system_getaddrinfo = socket.getaddrinfo
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_getaddrinfo(host, port, family, type, proto, flags, ttl_bucket):
+    return _system_getaddrinfo(host, port, family, type, proto, flags)
+
+
+def _getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo replacement that caches results per TTL window."""
+    ttl_bucket = int(time.time() // DNS_CACHE_TTL)
+    return _cached_getaddrinfo(host, port, family, type, proto, flags, ttl_bucket)
+
+
+def enable_dns_cache():
+    """Route all name lookups in this process through the DNS cache."""
+    socket.getaddrinfo = _getaddrinfo
+
 
 def parse_json_arg(json_str: Optional[str]) -> Optional[Dict]:
     """Parse JSON string argument."""
@@ -42,13 +91,68 @@ def parse_json_arg(json_str: Optional[str]) -> Optional[Dict]:
         sys.exit(1)
 
 
+def read_body(response: requests.Response, max_bytes: int) -> Tuple[bytes, bool]:
+    """Read at most `max_bytes` of a streamed response body.
+
+    Returns the bytes read and whether the body was truncated.
+    """
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total > max_bytes:
+            break
+    body = b"".join(chunks)
+    return body[:max_bytes], total > max_bytes
+
+
+def hexdump(data: bytes, limit: int = 256) -> str:
+    """Format the first `limit` bytes as a hex + ASCII preview."""
+    lines = []
+    for offset in range(0, min(len(data), limit), 16):
+        row = data[offset:offset + 16]
+        hex_part = ' '.join(f"{b:02x}" for b in row)
+        ascii_part = ''.join(chr(b) if 32 <= b < 127 else '.' for b in row)
+        lines.append(f"  {offset:08x}  {hex_part:<47}  {ascii_part}")
+    return '\n'.join(lines)
+
+
+def display_body(response: requests.Response, body: bytes, truncated: bool):
+    """Print a response body, pretty-printing JSON when it is complete."""
+    content_type = response.headers.get('Content-Type', '')
+    
+    if not truncated and 'json' in content_type:
+        try:
+            print(json.dumps(json.loads(body), indent=2))
+            return
+        except ValueError:
+            pass
+    
+    if content_type:
+        is_text = content_type.startswith('text/') or any(
+            kind in content_type for kind in ('json', 'xml', 'javascript')
+        )
+    else:
+        is_text = b'\x00' not in body
+    
+    if is_text:
+        print(body.decode(response.encoding or 'utf-8', errors='replace'))
+    else:
+        print(hexdump(body))
+    
+    if truncated:
+        print(f"\n... body truncated after {len(body):,} bytes (see --max-body-bytes)")
+
+
 def make_request(
     url: str,
     method: str,
     headers: Optional[Dict] = None,
     data: Optional[Dict] = None,
     params: Optional[Dict] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES
 ):
     """Make HTTP request and display results."""
     
@@ -82,38 +186,42 @@ def make_request(
     # Make the request
     try:
         print("Sending request...\n")
-        response = requests.request(
+        response = SESSION.request(
             method=method.upper(),
             url=url,
             headers=headers,
             json=data,
             params=params,
-            timeout=timeout
+            timeout=timeout,
+            stream=True
         )
         
+        # Read at most max_body_bytes, then release the connection: a fully
+        # read body returns it to the pool, a truncated one discards it
+        try:
+            body, truncated = read_body(response, max_body_bytes)
+        finally:
+            response.close()
+        
         # Display response
         print(f"Status Code: {response.status_code} {response.reason}")
         print(f"\nResponse Headers:")
+        rate_limit_headers = {}
         for key, value in response.headers.items():
             print(f"  {key}: {value}")
+            key_lower = key.lower()
+            if 'rate' in key_lower or 'limit' in key_lower:
+                rate_limit_headers[key] = value
         
         # Display response body
         print(f"\nResponse Body:")
-        try:
-            json_response = response.json()
-            print(json.dumps(json_response, indent=2))
-        except json.JSONDecodeError:
-            print(response.text)
+        display_body(response, body, truncated)
         
         # Display timing information
         print(f"\nTiming:")
         print(f"  Total time: {response.elapsed.total_seconds():.3f}s")
         
         # Display rate limit info if available
-        rate_limit_headers = {
-            k: v for k, v in response.headers.items() 
-            if 'rate' in k.lower() or 'limit' in k.lower()
-        }
         if rate_limit_headers:
             print(f"\nRate Limit Info:")
             for key, value in rate_limit_headers.items():
@@ -137,6 +245,172 @@ def make_request(
         return None
 
 
+def make_repeated_requests(
+    url: str,
+    method: str,
+    repeat: int,
+    headers: Optional[Dict] = None,
+    data: Optional[Dict] = None,
+    params: Optional[Dict] = None,
+    timeout: int = 30
+):
+    """Send the same request several times and display a summary."""
+    
+    print(f"\n{'='*60}")
+    print(f"Testing Endpoint: {method} {url} (x{repeat})")
+    print(f"{'='*60}\n")
+    
+    status_counts = Counter()
+    elapsed = []
+    failures = 0
+    
+    for _ in range(repeat):
+        try:
+            response = SESSION.request(
+                method=method.upper(),
+                url=url,
+                headers=headers,
+                json=data,
+                params=params,
+                timeout=timeout
+            )
+            status_counts[response.status_code] += 1
+            elapsed.append(response.elapsed.total_seconds())
+        except RequestException as e:
+            failures += 1
+            print(f"❌ Request failed: {e}", file=sys.stderr)
+    
+    print_summary(status_counts, elapsed, failures)
+    
+    # Report the worst status code seen so main() can pick the exit code
+    if failures or not status_counts:
+        return None
+    return max(status_counts)
+
+
+def _query_pairs(params: Optional[Dict]) -> Optional[List[Tuple[str, str]]]:
+    """Stringify query params the way requests does.
+
+    aiohttp only accepts str/int/float values, so booleans, lists and None
+    are flattened here: lists repeat the key, None values are dropped.
+    """
+    if not params:
+        return None
+    pairs = []
+    for key, values in params.items():
+        if isinstance(values, (str, bytes)) or not hasattr(values, '__iter__'):
+            values = [values]
+        for value in values:
+            if value is not None:
+                pairs.append((str(key), str(value)))
+    return pairs
+
+
+async def _run_async(
+    url: str,
+    method: str,
+    repeat: int,
+    concurrency: int,
+    headers: Optional[Dict] = None,
+    data: Optional[Dict] = None,
+    params: Optional[Dict] = None,
+    timeout: int = 30
+):
+    """Send `repeat` requests with at most `concurrency` in flight."""
+    status_counts = Counter()
+    elapsed = []
+    failures = 0
+    query = _query_pairs(params)
+    
+    async def _one(session, sem):
+        nonlocal failures
+        async with sem:
+            start = time.perf_counter()
+            try:
+                async with session.request(
+                    method.upper(), url, headers=headers, json=data, params=query
+                ) as response:
+                    await response.read()
+                    status_counts[response.status] += 1
+                    elapsed.append(time.perf_counter() - start)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                failures += 1
+                print(f"❌ Request failed: {str(e) or type(e).__name__}", file=sys.stderr)
+    
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL
+    )
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        connector=connector
+    ) as session:
+        sem = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*[_one(session, sem) for _ in range(repeat)])
+    
+    return status_counts, elapsed, failures
+
+
+def make_concurrent_requests(
+    url: str,
+    method: str,
+    repeat: int,
+    concurrency: int,
+    headers: Optional[Dict] = None,
+    data: Optional[Dict] = None,
+    params: Optional[Dict] = None,
+    timeout: int = 30
+):
+    """Send the same request several times concurrently and display a summary."""
+    
+    print(f"\n{'='*60}")
+    print(f"Testing Endpoint: {method} {url} (x{repeat}, concurrency {concurrency})")
+    print(f"{'='*60}\n")
+    
+    start = time.perf_counter()
+    status_counts, elapsed, failures = asyncio.run(_run_async(
+        url=url,
+        method=method,
+        repeat=repeat,
+        concurrency=concurrency,
+        headers=headers,
+        data=data,
+        params=params,
+        timeout=timeout
+    ))
+    wall_time = time.perf_counter() - start
+    
+    print(f"Completed {repeat} requests in {wall_time:.3f}s ({repeat / wall_time:.1f} req/s)\n")
+    print_summary(status_counts, elapsed, failures)
+    
+    if failures or not status_counts:
+        return None
+    return max(status_counts)
+
+
+def print_summary(status_counts: Counter, elapsed: list, failures: int):
+    """Display aggregated results of a repeated run."""
+    print("Status Codes:")
+    for code, count in sorted(status_counts.items()):
+        print(f"  {code}: {count}")
+    if failures:
+        print(f"  failed: {failures}")
+    
+    if elapsed:
+        print(f"\nTiming:")
+        print(f"  Min: {min(elapsed):.3f}s")
+        print(f"  Avg: {sum(elapsed) / len(elapsed):.3f}s")
+        print(f"  Max: {max(elapsed):.3f}s")
+    
+    print(f"\n{'='*60}")
+    if failures == 0 and all(200 <= code < 300 for code in status_counts):
+        print("✅ All requests successful!")
+    else:
+        print("⚠️  Some requests failed")
+    print(f"{'='*60}\n")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Test API endpoints',
@@ -182,6 +456,33 @@ def main():
         help='Request timeout in seconds (default: 30)'
     )
     
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=1,
+        help='Number of times to send the request (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=1,
+        help='Maximum requests in flight when repeating (default: 1, requires aiohttp above 1)'
+    )
+    
+    parser.add_argument(
+        '--max-body-bytes',
+        type=int,
+        default=DEFAULT_MAX_BODY_BYTES,
+        help=f'Maximum response body bytes to read and display (default: {DEFAULT_MAX_BODY_BYTES})'
+    )
+    
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Show DNS cache statistics'
+    )
+    
     args = parser.parse_args()
     
     # Parse JSON arguments
@@ -190,14 +491,56 @@ def main():
     params = parse_json_arg(args.params)
     
     # Make request
-    status_code = make_request(
-        url=args.url,
-        method=args.method,
-        headers=headers,
-        data=data,
-        params=params,
-        timeout=args.timeout
-    )
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    if args.max_body_bytes < 0:
+        parser.error('--max-body-bytes must not be negative')
+    if args.concurrency > 1 and aiohttp is None:
+        print("⚠️  aiohttp not installed (pip install aiohttp); sending requests sequentially",
+              file=sys.stderr)
+    
+    enable_dns_cache()
+    
+    try:
+        if args.repeat > 1 and args.concurrency > 1 and aiohttp is not None:
+            status_code = make_concurrent_requests(
+                url=args.url,
+                method=args.method,
+                repeat=args.repeat,
+                concurrency=args.concurrency,
+                headers=headers,
+                data=data,
+                params=params,
+                timeout=args.timeout
+            )
+        elif args.repeat > 1:
+            status_code = make_repeated_requests(
+                url=args.url,
+                method=args.method,
+                repeat=args.repeat,
+                headers=headers,
+                data=data,
+                params=params,
+                timeout=args.timeout
+            )
+        else:
+            status_code = make_request(
+                url=args.url,
+                method=args.method,
+                headers=headers,
+                data=data,
+                params=params,
+                timeout=args.timeout,
+                max_body_bytes=args.max_body_bytes
+            )
+    finally:
+        SESSION.close()
+    
+    if args.verbose:
+        info = _cached_getaddrinfo.cache_info()
+        print(f"DNS cache: {info.hits} hit(s), {info.misses} miss(es)")
     
     # Exit with appropriate code
     if status_code is None:
@@ -20,20 +20,52 @@ Examples:
     
     # Specify date column
     python analyze.py --file timeseries.csv --date-column date
+    
+    # Stream a CSV that does not fit in memory
+    python analyze.py --file huge.csv --chunksize 100000
 """
 
 import argparse
+import html
+import io
 import sys
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TextIO, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; no display needed
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 
+# Rows kept for sample-based stages when streaming with --chunksize
+SAMPLE_ROWS = 200_000
+
+# Frames larger than this are sampled for statistics, charts and correlations
+DEFAULT_STATS_SAMPLE = 500_000
+
+
+def arrow_matches_c_engine(file_path: Path) -> bool:
+    """Check whether the pyarrow CSV engine would load this file like the C engine.
+    
+    Arrow infers ISO dates, times and timestamps that the C engine leaves as
+    text, so files with such columns (judged from the first block) keep the
+    C engine. False as well when pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv
+        schema = pyarrow.csv.open_csv(file_path).schema
+    except (ImportError, ValueError):
+        return False
+    return not any(pa.types.is_temporal(field.type) for field in schema)
+
 
 def load_data(file_path: str) -> pd.DataFrame:
     """Load data from CSV or Excel file."""
@@ -43,92 +75,302 @@ def load_data(file_path: str) -> pd.DataFrame:
         raise FileNotFoundError(f"File not found: {file_path}")
     
     print(f"Loading data from {file_path}...")
+    start = time.perf_counter()
     
     if file_path.suffix.lower() == '.csv':
-        df = pd.read_csv(file_path)
+        df = None
+        if arrow_matches_c_engine(file_path):
+            try:
+                # Multithreaded Arrow parser
+                df = pd.read_csv(file_path, engine='pyarrow')
+            except (ImportError, ValueError):
+                # ArrowInvalid on ragged rows (the C engine pads them with
+                # NaN) and pandas versions without the pyarrow engine
+                pass
+        if df is None:
+            df = pd.read_csv(file_path)
     elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-        df = pd.read_excel(file_path)
+        try:
+            # Rust-based reader; needs python-calamine and pandas 2.2+
+            df = pd.read_excel(file_path, engine='calamine')
+        except (ImportError, ValueError):
+            df = pd.read_excel(file_path)
     else:
         raise ValueError(f"Unsupported file format: {file_path.suffix}")
     
+    print(f"Parsed in {time.perf_counter() - start:.2f}s", file=sys.stderr)
     print(f"✓ Loaded {len(df):,} rows and {len(df.columns)} columns\n")
     return df
 
 
-def explore_data(df: pd.DataFrame) -> dict:
-    """Perform initial data exploration."""
-    print("="*60)
-    print("DATA EXPLORATION")
-    print("="*60)
+def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numeric columns and turn low-cardinality text into categories."""
+    before = df.memory_usage(deep=True).sum()
+    
+    for col in df.select_dtypes(include=['integer']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include=['float']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    
+    if len(df) > 0:
+        for col in df.select_dtypes(include=['object']).columns:
+            if df[col].nunique() / len(df) < 0.5:
+                df[col] = df[col].astype('category')
+    
+    after = df.memory_usage(deep=True).sum()
+    print(f"✓ Optimized dtypes: {before / 1024**2:.2f} MB → {after / 1024**2:.2f} MB\n")
+    return df
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Hash each row's values (ignoring the index) to a single uint64."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def count_duplicates(df: pd.DataFrame) -> int:
+    """Count rows that repeat an earlier row, without building a boolean mask."""
+    _, counts = np.unique(row_hashes(df), return_counts=True)
+    return int((counts - 1).sum())
+
+
+def count_missing(df: pd.DataFrame) -> dict:
+    """Count missing values per column without building a boolean frame."""
+    missing = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'fc':
+            # NaN is the only missing marker for float/complex arrays
+            missing[col] = int(np.isnan(series.to_numpy()).sum())
+        else:
+            # Avoid to_numpy() here: it materializes object arrays for text
+            missing[col] = int(series.isna().sum())
+    return missing
+
+
+def explore_csv_in_chunks(file_path: str, chunksize: int,
+                          sample_rows: int = SAMPLE_ROWS) -> Tuple[dict, dict, pd.DataFrame]:
+    """Stream a CSV file chunk by chunk, folding exploration metrics as it goes.
+    
+    Row counts, missing values and numeric count/mean/std/min/max are exact.
+    Duplicates are counted from 64-bit row hashes with numbers hashed as
+    float64, so an int column that turns float in a later chunk still
+    matches. Quantiles come from a uniform random sample of `sample_rows`
+    rows, which is also returned for the sample-based stages.
+    """
+    file_path = Path(file_path)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    if file_path.suffix.lower() != '.csv':
+        raise ValueError(f"--chunksize only supports CSV files, got: {file_path.suffix}")
+    
+    print(f"Streaming data from {file_path} in chunks of {chunksize:,} rows...")
+    start = time.perf_counter()
+    
+    rng = np.random.default_rng(0)
+    rows = 0
+    memory = 0
+    missing = None
+    duplicates = 0
+    # Sorted unique row hashes from earlier chunks, 8 bytes per distinct row
+    seen_hashes = np.empty(0, dtype=np.uint64)
+    sample = None
+    sample_keys = None
+    
+    for chunk in pd.read_csv(file_path, chunksize=chunksize):
+        if missing is None:
+            columns = chunk.columns.tolist()
+            dtypes = chunk.dtypes.to_dict()
+            numeric_cols = chunk.select_dtypes(include=[np.number]).columns
+            missing = pd.Series(0, index=chunk.columns)
+            n = np.zeros(len(numeric_cols))
+            mean = np.zeros(len(numeric_cols))
+            m2 = np.zeros(len(numeric_cols))
+            col_min = np.full(len(numeric_cols), np.nan)
+            col_max = np.full(len(numeric_cols), np.nan)
+        
+        rows += len(chunk)
+        memory += chunk.memory_usage(deep=True).sum()
+        missing += pd.Series(count_missing(chunk))
+        
+        # Duplicates: one 64-bit hash per row instead of the full row key.
+        # Each chunk infers its own dtypes (an int column becomes float once
+        # a NaN shows up), so hash every number as float64 to keep 1 == 1.0
+        chunk_numeric = chunk.select_dtypes(include=[np.number]).columns
+        hashes = np.unique(row_hashes(chunk.astype({col: 'float64' for col in chunk_numeric})))
+        duplicates += len(chunk) - len(hashes)
+        pos = np.searchsorted(seen_hashes, hashes)
+        seen = np.zeros(len(hashes), dtype=bool)
+        if len(seen_hashes):
+            seen = seen_hashes[np.minimum(pos, len(seen_hashes) - 1)] == hashes
+        duplicates += int(seen.sum())
+        # Merge the new hashes in, keeping the array sorted
+        seen_hashes = np.insert(seen_hashes, pos[~seen], hashes[~seen])
+        
+        # Numeric moments: merge per-chunk count/mean/M2 (parallel Welford)
+        num = chunk[numeric_cols].apply(pd.to_numeric, errors='coerce')
+        n_b = num.count().to_numpy(dtype=float)
+        mean_b = num.mean().fillna(0).to_numpy()
+        m2_b = (num.var(ddof=0).fillna(0) * n_b).to_numpy()
+        total = n + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean_b - mean
+            mean = np.where(total > 0, mean + delta * n_b / total, 0)
+            m2 = np.where(total > 0, m2 + m2_b + delta ** 2 * n * n_b / total, 0)
+        n = total
+        col_min = np.fmin(col_min, num.min().to_numpy(dtype=float))
+        col_max = np.fmax(col_max, num.max().to_numpy(dtype=float))
+        
+        # Uniform sample: keep the rows with the smallest random keys
+        keys = rng.random(len(chunk))
+        if sample is None:
+            sample, sample_keys = chunk, keys
+        else:
+            sample = pd.concat([sample, chunk])
+            sample_keys = np.concatenate([sample_keys, keys])
+        if len(sample) > sample_rows:
+            keep = np.sort(np.argpartition(sample_keys, sample_rows)[:sample_rows])
+            sample, sample_keys = sample.iloc[keep], sample_keys[keep]
+    
+    if missing is None:
+        raise ValueError(f"No data found in {file_path}")
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.where(n > 1, np.sqrt(m2 / (n - 1)), np.nan)
+    quantiles = sample[numeric_cols].apply(pd.to_numeric, errors='coerce').quantile([0.25, 0.5, 0.75])
+    numeric_summary = {
+        col: {
+            'count': n[i],
+            'mean': mean[i] if n[i] > 0 else np.nan,
+            'std': std[i],
+            'min': col_min[i],
+            '25%': quantiles[col][0.25],
+            '50%': quantiles[col][0.5],
+            '75%': quantiles[col][0.75],
+            'max': col_max[i],
+        }
+        for i, col in enumerate(numeric_cols)
+    }
     
+    exploration = {
+        'shape': (rows, len(columns)),
+        'columns': columns,
+        'dtypes': dtypes,
+        'missing': missing.to_dict(),
+        'duplicates': duplicates,
+        'memory_mb': memory / 1024**2
+    }
+    
+    print(f"Parsed in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    print(f"✓ Streamed {rows:,} rows and {len(columns)} columns")
+    print(f"  Quantiles, visualizations and correlations use a random sample of {len(sample):,} rows\n")
+    return exploration, numeric_summary, sample
+
+
+def explore_data(df: pd.DataFrame, out: Optional[TextIO] = None) -> dict:
+    """Perform initial data exploration."""
     exploration = {
         'shape': df.shape,
         'columns': df.columns.tolist(),
         'dtypes': df.dtypes.to_dict(),
-        'missing': df.isnull().sum().to_dict(),
-        'duplicates': df.duplicated().sum()
+        'missing': count_missing(df),
+        'duplicates': count_duplicates(df),
+        'memory_mb': df.memory_usage(deep=True).sum() / 1024**2
     }
     
-    print(f"\nShape: {df.shape[0]:,} rows × {df.shape[1]} columns")
-    print(f"Memory usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
-    print(f"Duplicate rows: {exploration['duplicates']:,}")
+    print_exploration(exploration, out=out)
+    return exploration
+
+
+def print_exploration(exploration: dict, out: Optional[TextIO] = None):
+    """Print the data exploration results."""
+    print("="*60, file=out)
+    print("DATA EXPLORATION", file=out)
+    print("="*60, file=out)
+    
+    row_count, col_count = exploration['shape']
+    print(f"\nShape: {row_count:,} rows × {col_count} columns", file=out)
+    print(f"Memory usage: {exploration['memory_mb']:.2f} MB", file=out)
+    print(f"Duplicate rows: {exploration['duplicates']:,}", file=out)
     
     # Missing values
     missing = pd.Series(exploration['missing'])
     missing = missing[missing > 0]
     if len(missing) > 0:
-        print("\nMissing values:")
+        print("\nMissing values:", file=out)
         for col, count in missing.items():
-            pct = (count / len(df)) * 100
-            print(f"  {col}: {count:,} ({pct:.1f}%)")
+            pct = (count / row_count) * 100
+            print(f"  {col}: {count:,} ({pct:.1f}%)", file=out)
     else:
-        print("\n✓ No missing values")
+        print("\n✓ No missing values", file=out)
     
     # Data types
-    print("\nData types:")
-    dtype_counts = df.dtypes.value_counts()
+    print("\nData types:", file=out)
+    dtype_counts = pd.Series(exploration['dtypes']).value_counts()
     for dtype, count in dtype_counts.items():
-        print(f"  {dtype}: {count} columns")
-    
-    return exploration
+        print(f"  {dtype}: {count} columns", file=out)
 
 
-def statistical_summary(df: pd.DataFrame) -> dict:
-    """Generate statistical summaries."""
-    print("\n" + "="*60)
-    print("STATISTICAL SUMMARY")
-    print("="*60 + "\n")
+def statistical_summary(df: pd.DataFrame, numeric_summary: Optional[dict] = None,
+                        out: Optional[TextIO] = None) -> dict:
+    """Generate statistical summaries.
+    
+    A precomputed `numeric_summary` (e.g. from chunked streaming) is used
+    instead of describe() on `df` when given.
+    """
+    print("\n" + "="*60, file=out)
+    print("STATISTICAL SUMMARY", file=out)
+    print("="*60 + "\n", file=out)
     
     # Numeric columns
     numeric_cols = df.select_dtypes(include=[np.number]).columns
-    if len(numeric_cols) > 0:
-        print("Numeric columns:")
-        print(df[numeric_cols].describe())
+    if numeric_summary is None:
+        numeric_summary = df[numeric_cols].describe().to_dict() if len(numeric_cols) > 0 else {}
+    if numeric_summary:
+        print("Numeric columns:", file=out)
+        print(pd.DataFrame(numeric_summary), file=out)
     
     # Categorical columns
     categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    cat_vcs = {}
+    for col in categorical_cols:
+        vc = df[col].value_counts()
+        # A sampled categorical keeps every category; drop the unused ones
+        cat_vcs[col] = vc[vc > 0]
     if len(categorical_cols) > 0:
-        print("\n\nCategorical columns:")
-        for col in categorical_cols:
-            unique_count = df[col].nunique()
-            print(f"\n  {col}: {unique_count} unique values")
+        print("\n\nCategorical columns:", file=out)
+        for col, vc in cat_vcs.items():
+            unique_count = len(vc)
+            print(f"\n  {col}: {unique_count} unique values", file=out)
             if unique_count <= 10:
-                value_counts = df[col].value_counts()
-                for val, count in value_counts.items():
-                    pct = (count / len(df)) * 100
-                    print(f"    {val}: {count:,} ({pct:.1f}%)")
+                # At most ten rows, so format them directly from the counts
+                pcts = vc / len(df) * 100
+                print("\n".join(
+                    f"    {val}: {count:,} ({pct:.1f}%)"
+                    for val, count, pct in zip(vc.index, vc.to_numpy(), pcts.to_numpy())
+                ), file=out)
     
     return {
-        'numeric_summary': df[numeric_cols].describe().to_dict() if len(numeric_cols) > 0 else {},
-        'categorical_summary': {col: df[col].value_counts().to_dict() for col in categorical_cols}
+        'numeric_summary': numeric_summary,
+        'categorical_summary': {col: vc.to_dict() for col, vc in cat_vcs.items()}
     }
 
 
-def create_visualizations(df: pd.DataFrame, output_dir: Path):
+def correlation_matrix(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """Compute the correlation matrix of numeric columns (None if fewer than two)."""
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    if len(numeric_cols) < 2:
+        return None
+    return df[numeric_cols].corr()
+
+
+def create_visualizations(df: pd.DataFrame, output_dir: Path,
+                          corr: Optional[pd.DataFrame] = None,
+                          out: Optional[TextIO] = None):
     """Create visualizations."""
-    print("\n" + "="*60)
-    print("CREATING VISUALIZATIONS")
-    print("="*60 + "\n")
+    print("\n" + "="*60, file=out)
+    print("CREATING VISUALIZATIONS", file=out)
+    print("="*60 + "\n", file=out)
     
     output_dir.mkdir(exist_ok=True)
     
@@ -138,31 +380,35 @@ def create_visualizations(df: pd.DataFrame, output_dir: Path):
     numeric_cols = df.select_dtypes(include=[np.number]).columns
     
     if len(numeric_cols) == 0:
-        print("No numeric columns to visualize")
+        print("No numeric columns to visualize", file=out)
         return
     
-    # Distribution plots for numeric columns
-    for col in numeric_cols[:5]:  # Limit to first 5 columns
-        plt.figure()
-        df[col].hist(bins=30, edgecolor='black')
-        plt.title(f'Distribution of {col}')
-        plt.xlabel(col)
-        plt.ylabel('Frequency')
-        filename = output_dir / f'dist_{col.replace(" ", "_")}.png'
-        plt.savefig(filename, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Created {filename}")
+    # Distribution plots for numeric columns, side by side in one figure
+    hist_cols = numeric_cols[:5]  # Limit to first 5 columns
+    fig, axes = plt.subplots(1, len(hist_cols), figsize=(4 * len(hist_cols), 4), squeeze=False)
+    for col, ax in zip(hist_cols, axes[0]):
+        counts, edges = np.histogram(df[col].dropna().to_numpy(), bins=30)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', edgecolor='black')
+        ax.set_title(f'Distribution of {col}')
+        ax.set_xlabel(col)
+        ax.set_ylabel('Frequency')
+    fig.tight_layout()
+    filename = output_dir / 'distributions.png'
+    fig.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    print(f"✓ Created {filename}", file=out)
     
     # Correlation heatmap
     if len(numeric_cols) > 1:
+        if corr is None:
+            corr = correlation_matrix(df)
         plt.figure(figsize=(12, 8))
-        correlation = df[numeric_cols].corr()
-        sns.heatmap(correlation, annot=True, cmap='coolwarm', center=0, fmt='.2f')
+        sns.heatmap(corr, annot=True, cmap='coolwarm', center=0, fmt='.2f')
         plt.title('Correlation Matrix')
         filename = output_dir / 'correlation_heatmap.png'
         plt.savefig(filename, dpi=150, bbox_inches='tight')
         plt.close()
-        print(f"✓ Created {filename}")
+        print(f"✓ Created {filename}", file=out)
     
     # Box plots for numeric columns
     if len(numeric_cols) <= 5:
@@ -173,15 +419,16 @@ def create_visualizations(df: pd.DataFrame, output_dir: Path):
         filename = output_dir / 'boxplots.png'
         plt.savefig(filename, dpi=150, bbox_inches='tight')
         plt.close()
-        print(f"✓ Created {filename}")
+        print(f"✓ Created {filename}", file=out)
 
 
-def generate_insights(df: pd.DataFrame, exploration: dict, stats: dict) -> list:
+def generate_insights(df: pd.DataFrame, exploration: dict, stats: dict,
+                      corr: Optional[pd.DataFrame] = None) -> list:
     """Generate automated insights."""
     insights = []
     
     # Dataset size insights
-    row_count = df.shape[0]
+    row_count = exploration['shape'][0]
     if row_count < 100:
         insights.append(f"⚠️  Small dataset ({row_count:,} rows) - results may not be statistically significant")
     elif row_count > 1_000_000:
@@ -189,29 +436,35 @@ def generate_insights(df: pd.DataFrame, exploration: dict, stats: dict) -> list:
     
     # Missing data insights
     missing = pd.Series(exploration['missing'])
-    missing_pct = (missing / len(df) * 100)
+    missing_pct = (missing / row_count * 100)
     high_missing = missing_pct[missing_pct > 20]
     if len(high_missing) > 0:
         insights.append(f"⚠️  {len(high_missing)} column(s) have >20% missing data: {', '.join(high_missing.index)}")
     
     # Duplicate insights
     if exploration['duplicates'] > 0:
-        pct = (exploration['duplicates'] / len(df)) * 100
+        pct = (exploration['duplicates'] / row_count) * 100
         insights.append(f"⚠️  Found {exploration['duplicates']:,} duplicate rows ({pct:.1f}%)")
     
     # Correlation insights
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    if len(numeric_cols) > 1:
-        corr = df[numeric_cols].corr()
-        high_corr = []
-        for i in range(len(corr.columns)):
-            for j in range(i+1, len(corr.columns)):
-                if abs(corr.iloc[i, j]) > 0.7:
-                    high_corr.append((corr.columns[i], corr.columns[j], corr.iloc[i, j]))
+    if corr is None:
+        corr = correlation_matrix(df)
+    if corr is not None:
+        # Scan the upper triangle in one vectorized pass
+        arr = corr.to_numpy()
+        rows, cols = np.triu_indices_from(arr, k=1)
+        vals = arr[rows, cols]
+        strength = np.abs(vals)
+        idx = np.nonzero(strength > 0.7)[0]
         
-        if high_corr:
-            insights.append(f"📈 Found {len(high_corr)} strong correlation(s):")
-            for col1, col2, val in high_corr[:3]:  # Show top 3
+        if len(idx) > 0:
+            # Pick the 3 strongest without sorting every pair, then order just those
+            k = min(3, len(idx))
+            top = idx[np.argpartition(-strength[idx], k - 1)[:k]]
+            top = top[np.argsort(-strength[top])]
+            names = np.asarray(corr.columns)
+            insights.append(f"📈 Found {len(idx)} strong correlation(s):")
+            for col1, col2, val in zip(names[rows[top]], names[cols[top]], vals[top]):
                 insights.append(f"   • {col1} ↔ {col2}: {val:.2f}")
     
     return insights
@@ -224,7 +477,7 @@ def generate_report(df: pd.DataFrame, exploration: dict, stats: dict,
     print("GENERATING REPORT")
     print("="*60 + "\n")
     
-    html = f"""
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -247,35 +500,37 @@ def generate_report(df: pd.DataFrame, exploration: dict, stats: dict,
         
         <h2>Dataset Overview</h2>
         <ul>
-            <li><strong>Rows:</strong> {df.shape[0]:,}</li>
-            <li><strong>Columns:</strong> {df.shape[1]}</li>
-            <li><strong>Memory Usage:</strong> {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB</li>
+            <li><strong>Rows:</strong> {exploration['shape'][0]:,}</li>
+            <li><strong>Columns:</strong> {exploration['shape'][1]}</li>
+            <li><strong>Memory Usage:</strong> {exploration['memory_mb']:.2f} MB</li>
             <li><strong>Duplicate Rows:</strong> {exploration['duplicates']:,}</li>
         </ul>
         
         <h2>Key Insights</h2>
-    """
+    """]
     
     for insight in insights:
         warning_class = 'warning' if '⚠️' in insight else ''
-        html += f'<div class="insight {warning_class}">{insight}</div>\n'
+        parts.append(f'<div class="insight {warning_class}">{html.escape(insight)}</div>\n')
     
-    html += """
+    parts.append("""
         <h2>Statistical Summary</h2>
         <h3>Numeric Columns</h3>
-    """
+    """)
     
     if stats['numeric_summary']:
-        html += df.describe().to_html()
+        parts.append(pd.DataFrame(stats['numeric_summary']).to_html())
     
-    html += """
+    parts.append("""
         <h2>Visualizations</h2>
         <p>See the 'visualizations' folder for generated charts.</p>
     </body>
     </html>
-    """
+    """)
     
-    output_file.write_text(html)
+    # Write fragments directly instead of joining them into one large string
+    with output_file.open('w', encoding='utf-8') as f:
+        f.writelines(parts)
     print(f"✓ Report saved to {output_file}")
 
 
@@ -289,33 +544,62 @@ def main():
     parser.add_argument('--output', '-o', default='analysis_report.html', help='Output report file')
     parser.add_argument('--date-column', help='Name of date column for time series analysis')
     parser.add_argument('--viz-dir', default='visualizations', help='Directory for visualizations')
+    parser.add_argument('--chunksize', type=int,
+                        help='Stream CSV files in chunks of this many rows (for files larger than RAM)')
+    parser.add_argument('--sample', type=int, default=DEFAULT_STATS_SAMPLE,
+                        help=f'Sample this many rows for statistics, visualizations and correlations '
+                             f'on larger datasets; 0 disables (default: {DEFAULT_STATS_SAMPLE:,})')
     
     args = parser.parse_args()
     
     try:
-        # Load data
-        df = load_data(args.file)
+        # Load data (or stream it, keeping only a sample in memory)
+        if args.chunksize:
+            exploration, numeric_summary, df = explore_csv_in_chunks(args.file, args.chunksize)
+        else:
+            df = load_data(args.file)
+            numeric_summary = None
         
         # Convert date column if specified
         if args.date_column and args.date_column in df.columns:
             df[args.date_column] = pd.to_datetime(df[args.date_column])
             print(f"✓ Converted '{args.date_column}' to datetime\n")
         
-        # Explore data
-        exploration = explore_data(df)
+        # Shrink dtypes so every later pass moves fewer bytes
+        df = optimize_dtypes(df)
         
-        # Statistical summary
-        stats = statistical_summary(df)
+        # Statistics, charts and correlations tolerate sampling; exploration
+        # (missing values, duplicates) always uses the full frame
+        df_stats = df
+        if args.sample and len(df) > args.sample:
+            df_stats = df.sample(n=args.sample, random_state=0)
+            print(f"ℹ️  Statistics, visualizations and correlations use a random sample "
+                  f"of {args.sample:,} of {len(df):,} rows\n")
         
-        # Create visualizations
+        # Explore, summarize and visualize concurrently; each stage writes to its
+        # own buffer and the buffers are printed in a fixed order afterwards
         viz_dir = Path(args.viz_dir)
-        create_visualizations(df, viz_dir)
+        corr = correlation_matrix(df_stats)
+        explore_out, stats_out, viz_out = io.StringIO(), io.StringIO(), io.StringIO()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            fut_viz = executor.submit(create_visualizations, df_stats, viz_dir, corr=corr, out=viz_out)
+            fut_stats = executor.submit(statistical_summary, df_stats,
+                                        numeric_summary=numeric_summary, out=stats_out)
+            if args.chunksize:
+                print_exploration(exploration, out=explore_out)
+            else:
+                exploration = executor.submit(explore_data, df, out=explore_out).result()
+            stats = fut_stats.result()
+            fut_viz.result()
+        
+        for buffer in (explore_out, stats_out, viz_out):
+            sys.stdout.write(buffer.getvalue())
         
         # Generate insights
         print("\n" + "="*60)
         print("KEY INSIGHTS")
         print("="*60 + "\n")
-        insights = generate_insights(df, exploration, stats)
+        insights = generate_insights(df, exploration, stats, corr=corr)
         for insight in insights:
             print(insight)
         
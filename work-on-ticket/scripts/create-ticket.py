@@ -7,13 +7,61 @@ Usage: python create-ticket.py --project SAM1 --summary "Ticket summary" --descr
 
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import json
 import subprocess
 import re
 from jira_config import get_config
 
 
+class _CreateSafeRetry(Retry):
+    """Retry that resends a POST only when Jira rejected it unprocessed.
+
+    POST is left out of allowed_methods, so connection-read timeouts and
+    5xx replies (where the ticket may already exist) are never replayed.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == "POST":
+            return bool(self.total) and status_code in (429, 503)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Shared session: keeps the Jira connection alive and retries transient
+# failures (urllib3 honours Retry-After on 429/503). raise_on_status=False
+# hands the last response back once retries run out, so callers still see
+# the status code and body instead of a RetryError.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(max_retries=_CreateSafeRetry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods={"GET", "PUT"},
+    raise_on_status=False
+)))
+
+
+class _BranchCharFilter(dict):
+    """str.translate table that drops everything but a-z, 0-9, whitespace and '-'.
+
+    Entries are filled in on first lookup, so the table covers all of
+    Unicode while only storing characters that have actually been seen.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        keep = char in _BRANCH_CHARS or char.isspace()
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+
+_BRANCH_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+_BRANCH_FILTER = _BranchCharFilter()
+_WHITESPACE = re.compile(r"\s+")
+
+
 def create_jira_ticket(config, project_key, summary, description, issue_type="Task"):
     """Create a new Jira ticket."""
     auth = HTTPBasicAuth(config['email'], config['token'])
@@ -52,7 +100,7 @@ def create_jira_ticket(config, project_key, summary, description, issue_type="Ta
         }
     }
     
-    response = requests.post(url, headers=headers, auth=auth, json=payload)
+    response = _SESSION.post(url, headers=headers, auth=auth, json=payload, timeout=30)
     
     if response.status_code == 201:
         data = response.json()
@@ -67,25 +115,29 @@ def create_jira_ticket(config, project_key, summary, description, issue_type="Ta
         return None
 
 
+def _git(*args):
+    """Run a git command, capturing its output; raises CalledProcessError on failure."""
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True)
+
+
 def create_branch(ticket_key, summary):
     """Create a git branch for the ticket."""
     # Sanitize summary for branch name
-    branch_name = summary.lower()
-    branch_name = re.sub(r'[^a-z0-9\s-]', '', branch_name)
-    branch_name = re.sub(r'\s+', '-', branch_name)
+    branch_name = summary.lower().translate(_BRANCH_FILTER)
+    branch_name = _WHITESPACE.sub('-', branch_name)
     branch_name = branch_name[:50]  # Limit length
     
     full_branch_name = f"feature/{ticket_key.lower()}-{branch_name}"
     
     # Create and checkout branch
-    subprocess.run(["git", "checkout", "-b", full_branch_name], check=True)
+    _git("checkout", "-b", full_branch_name)
     
     return full_branch_name
 
 
 def push_branch(branch_name):
     """Push branch to remote."""
-    subprocess.run(["git", "push", "-u", "origin", branch_name], check=True)
+    _git("push", "--set-upstream", "origin", branch_name)
 
 
 def create_pull_request(branch_name, ticket_key, summary, ticket_url):
@@ -153,7 +205,7 @@ def main():
         branch_name = create_branch(ticket['key'], args.summary)
         print(f"✓ Created branch: {branch_name}")
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to create branch: {e}")
+        print(f"❌ Failed to create branch: {e.stderr.strip() or e}")
         exit(1)
     
     print(f"\n📤 Pushing to GitHub...")
@@ -161,7 +213,7 @@ def main():
         push_branch(branch_name)
         print(f"✓ Pushed to origin/{branch_name}")
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to push: {e}")
+        print(f"❌ Failed to push: {e.stderr.strip() or e}")
         exit(1)
     
     if args.no_pr:
@@ -183,4 +235,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        _SESSION.close()
@@ -15,64 +15,38 @@ import argparse
 import os
 import sys
 import json
+from collections import deque
 from typing import Dict, Any, Optional
 from pathlib import Path
-import requests
-from requests.auth import HTTPBasicAuth
 
-# Import config manager
+# Import Jira client
 sys.path.insert(0, str(Path(__file__).parent))
-from jira_config import get_config
-
-
-class JiraClient:
-    def __init__(self, profile: Optional[str] = None):
-        # Get credentials from config file or environment
-        credentials = get_config(profile)
-        
-        self.base_url = credentials['url'].rstrip('/')
-        self.email = credentials['email']
-        self.api_token = credentials['token']
-        
-        self.auth = HTTPBasicAuth(self.email, self.api_token)
-        self.session = requests.Session()
-        self.session.auth = self.auth
-        self.session.headers.update({'Accept': 'application/json'})
-    
-    def get_issue(self, issue_key: str) -> Dict[str, Any]:
-        """Fetch issue details from Jira."""
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-        
-        params = {
-            'fields': 'summary,description,status,priority,assignee,reporter,issuetype,created,updated,comment,subtasks,parent'
-        }
-        
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                print("❌ Authentication failed. Check your JIRA_EMAIL and JIRA_API_TOKEN")
-            elif e.response.status_code == 404:
-                print(f"❌ Ticket {issue_key} not found")
-            else:
-                print(f"❌ HTTP Error: {e}")
-            sys.exit(1)
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error connecting to Jira: {e}")
-            sys.exit(1)
-    
-    def get_transitions(self, issue_key: str) -> list:
-        """Get available status transitions for the issue."""
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
-        
-        try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.json().get('transitions', [])
-        except:
-            return []
+from jira_client import JiraClient
+
+# Fields requested by get_issue
+ISSUE_FIELDS = (
+    'summary,description,status,priority,assignee,reporter,issuetype,'
+    'created,updated,comment,subtasks,parent'
+)
+
+
+def fetch_issue(client: JiraClient, issue_key: str) -> Dict[str, Any]:
+    """Fetch issue details from Jira, exiting with a message on failure."""
+    import requests
+    
+    try:
+        return client.get_issue(issue_key, fields=ISSUE_FIELDS)
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 401:
+            print("❌ Authentication failed. Check your JIRA_EMAIL and JIRA_API_TOKEN")
+        elif e.response.status_code == 404:
+            print(f"❌ Ticket {issue_key} not found")
+        else:
+            print(f"❌ HTTP Error: {e}")
+        sys.exit(1)
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Error connecting to Jira: {e}")
+        sys.exit(1)
 
 
 def extract_acceptance_criteria(description: str) -> Optional[str]:
@@ -128,41 +102,43 @@ def format_markdown(issue_data: Dict[str, Any]) -> str:
     # Comments
     comments = fields.get('comment', {}).get('comments', [])
     
-    # Build markdown
-    md = f"# [{issue_key}] {summary}\n\n"
-    md += f"**Type:** {issue_type}  \n"
-    md += f"**Status:** {status}  \n"
-    md += f"**Priority:** {priority}  \n"
-    md += f"**Assignee:** {assignee_name}  \n"
-    md += f"**Reporter:** {reporter_name}  \n"
-    md += f"\n## Description\n\n{description_text}\n"
+    # Build markdown from fragments joined once at the end
+    parts = [
+        f"# [{issue_key}] {summary}\n\n",
+        f"**Type:** {issue_type}  \n",
+        f"**Status:** {status}  \n",
+        f"**Priority:** {priority}  \n",
+        f"**Assignee:** {assignee_name}  \n",
+        f"**Reporter:** {reporter_name}  \n",
+        f"\n## Description\n\n{description_text}\n",
+    ]
     
     # Try to extract acceptance criteria
     ac = extract_acceptance_criteria(description_text)
     if ac:
-        md += f"\n## Acceptance Criteria\n\n{ac}\n"
+        parts.append(f"\n## Acceptance Criteria\n\n{ac}\n")
     
     # Add comments if any
     if comments:
-        md += f"\n## Comments ({len(comments)})\n\n"
+        parts.append(f"\n## Comments ({len(comments)})\n\n")
         for comment in comments[:5]:  # Show last 5 comments
             author = comment.get('author', {}).get('displayName', 'Unknown')
             body = comment.get('body', '')
             if isinstance(body, dict):
                 body = extract_text_from_adf(body)
-            md += f"**{author}:**\n{body}\n\n"
+            parts.append(f"**{author}:**\n{body}\n\n")
     
     # Subtasks
     subtasks = fields.get('subtasks', [])
     if subtasks:
-        md += f"\n## Subtasks ({len(subtasks)})\n\n"
+        parts.append(f"\n## Subtasks ({len(subtasks)})\n\n")
         for subtask in subtasks:
             sub_key = subtask.get('key')
             sub_summary = subtask.get('fields', {}).get('summary', 'No summary')
             sub_status = subtask.get('fields', {}).get('status', {}).get('name', 'Unknown')
-            md += f"- [{sub_key}] {sub_summary} ({sub_status})\n"
+            parts.append(f"- [{sub_key}] {sub_summary} ({sub_status})\n")
     
-    return md
+    return ''.join(parts)
 
 
 def extract_text_from_adf(adf: dict) -> str:
@@ -170,20 +146,21 @@ def extract_text_from_adf(adf: dict) -> str:
     if not isinstance(adf, dict):
         return str(adf)
     
+    # Walk the tree with an explicit stack; children are pushed reversed
+    # so text comes out in document order
     text_parts = []
-    
-    def extract(node):
+    append = text_parts.append
+    stack = deque([adf])
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
             if node.get('type') == 'text':
-                text_parts.append(node.get('text', ''))
+                append(node.get('text', ''))
             elif 'content' in node:
-                for child in node['content']:
-                    extract(child)
+                stack.extend(reversed(node['content']))
         elif isinstance(node, list):
-            for item in node:
-                extract(item)
+            stack.extend(reversed(node))
     
-    extract(adf)
     return ' '.join(text_parts)
 
 
@@ -204,6 +181,19 @@ def format_plain(issue_data: Dict[str, Any]) -> str:
     return output
 
 
+def write_output(fp, issue_data: Dict[str, Any], fmt: str, suffix: str = '') -> None:
+    """Write the formatted issue to fp."""
+    if fmt == 'json':
+        # json.dumps uses the C encoder; json.dump with indent falls back to
+        # the pure-Python one and writes once per token
+        fp.write(format_json(issue_data))
+    elif fmt == 'markdown':
+        fp.write(format_markdown(issue_data))
+    else:
+        fp.write(format_plain(issue_data))
+    fp.write(suffix)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Fetch Jira ticket details',
@@ -215,6 +205,7 @@ def main():
     parser.add_argument('--output', '-o', help='Output file (default: stdout)')
     parser.add_argument('--show-transitions', action='store_true', help='Show available status transitions')
     parser.add_argument('--profile', '-p', help='Jira profile to use (from .jira-config)')
+    parser.add_argument('--no-cache', action='store_true', help='Clear the local response cache and fetch fresh data')
     
     args = parser.parse_args()
     
@@ -222,33 +213,30 @@ def main():
     if args.profile:
         print(f"🔍 Using profile: {args.profile}")
     print(f"🔍 Fetching ticket {args.ticket}...\n")
-    client = JiraClient(args.profile)
+    client = JiraClient(args.profile, use_cache=not args.no_cache)
     
     # Fetch issue
-    issue_data = client.get_issue(args.ticket)
-    
-    # Format output
-    if args.format == 'json':
-        output = format_json(issue_data)
-    elif args.format == 'markdown':
-        output = format_markdown(issue_data)
-    else:
-        output = format_plain(issue_data)
+    issue_data = fetch_issue(client, args.ticket)
     
     # Show transitions if requested
+    transitions_output = ''
     if args.show_transitions:
-        transitions = client.get_transitions(args.ticket)
-        output += "\n\n## Available Transitions\n\n"
+        try:
+            transitions = client.get_transitions(args.ticket)
+        except Exception:
+            transitions = []
+        transitions_output += "\n\n## Available Transitions\n\n"
         for trans in transitions:
-            output += f"- {trans['name']} (ID: {trans['id']})\n"
+            transitions_output += f"- {trans['name']} (ID: {trans['id']})\n"
     
     # Write output
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(output)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            write_output(f, issue_data, args.format, transitions_output)
         print(f"✓ Saved to {args.output}")
     else:
-        print(output)
+        write_output(sys.stdout, issue_data, args.format, transitions_output)
+        print()
     
     print(f"\n✓ Ticket {args.ticket} fetched successfully")
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Jira REST Client
+
+Shared JiraClient used by fetch-ticket.py and start-work.py. Sessions are
+kept per Jira site and user for the life of the process, so every client
+reuses the same warm connection pool.
+"""
+
+import json
+from typing import Any, Dict, Optional, Tuple
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from jira_config import get_config
+
+# Local SQLite cache for GET responses (used when requests-cache is installed)
+CACHE_NAME = str(Path.home() / '.cache' / 'jira_skill')
+CACHE_EXPIRE_SECONDS = 300
+
+# Process-wide sessions, keyed by (base_url, email)
+_SESSIONS: Dict[Tuple[str, str], Any] = {}
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _build_session(base_url: str, email: str, api_token: str):
+    """Create a pooled, retrying session, cached on disk when possible."""
+    # HTTP stack is imported here so --help and argument errors stay fast
+    import requests
+    from requests.adapters import HTTPAdapter
+    from requests.auth import HTTPBasicAuth
+    from urllib3.util.retry import Retry
+    try:
+        import requests_cache
+    except ImportError:
+        requests_cache = None
+    
+    if requests_cache is not None:
+        # Only successful GETs are cached; POSTs always go to Jira
+        session = requests_cache.CachedSession(
+            cache_name=CACHE_NAME,
+            backend='sqlite',
+            expire_after=CACHE_EXPIRE_SECONDS,
+            allowable_codes=(200,),
+            allowable_methods=('GET',)
+        )
+    else:
+        session = requests.Session()
+    # Jira-specific adapter, mounted on the site URL only: a couple of pools,
+    # each big enough to keep a warm socket per concurrent call without
+    # blocking. Other hosts keep requests' default adapters. Only GETs
+    # are retried (urllib3 honours Retry-After on 429/503): a replayed
+    # comment POST would post twice, and a replayed transition fails once
+    # the status has already moved. raise_on_status=False returns the last
+    # response so raise_for_status() reports the real HTTP error.
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16, pool_block=False, max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods={"GET"},
+        raise_on_status=False
+    ))
+    # Trailing slash so e.g. https://site.atlassian.net.example.com never matches
+    session.mount(base_url + '/', adapter)
+    session.auth = HTTPBasicAuth(email, api_token)
+    session.headers.update({
+        'Accept': 'application/json',
+        'Content-Type': 'application/json',
+        # Explicit, since some proxies strip the default
+        'Connection': 'keep-alive'
+    })
+    return session
+
+
+class JiraClient:
+    def __init__(self, profile: Optional[str] = None, use_cache: bool = True):
+        # Get credentials from config file or environment
+        credentials = get_config(profile)
+        
+        self.base_url = credentials['url'].rstrip('/')
+        self.email = credentials['email']
+        self.api_token = credentials['token']
+        
+        key = (self.base_url, self.email)
+        if key not in _SESSIONS:
+            _SESSIONS[key] = _build_session(self.base_url, self.email, self.api_token)
+        self.session = _SESSIONS[key]
+        self.auth = self.session.auth
+        self._cached = hasattr(self.session, 'cache')
+        if not use_cache:
+            self._invalidate_cache()
+        
+        # Transitions returned inline by get_issue (expand=transitions)
+        self._transitions_cache = {}
+    
+    def get_issue(self, issue_key: str, fields: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch issue details, including its available transitions.
+        
+        fields is a comma-separated field list; all fields when omitted.
+        """
+        url = f"{self.base_url}/rest/api/3/issue/{issue_key}?expand=transitions"
+        if fields:
+            url += f"&fields={fields}"
+        response = self.session.get(url)
+        response.raise_for_status()
+        data = _loads(response.content)
+        if 'transitions' in data:
+            self._transitions_cache[issue_key] = data.pop('transitions')
+        return data
+    
+    def get_transitions(self, issue_key: str) -> list:
+        """Get available status transitions for the issue."""
+        if issue_key in self._transitions_cache:
+            return self._transitions_cache[issue_key]
+        
+        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
+        response = self.session.get(url)
+        response.raise_for_status()
+        return _loads(response.content).get('transitions', [])
+    
+    def transition_issue(self, issue_key: str, transition_name: str) -> bool:
+        """Transition issue to new status."""
+        transitions = self.get_transitions(issue_key)
+        
+        transition_id = None
+        for trans in transitions:
+            if trans['name'].lower() == transition_name.lower():
+                transition_id = trans['id']
+                break
+        
+        if not transition_id:
+            print(f"⚠️  Transition '{transition_name}' not available")
+            return False
+        
+        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
+        data = {'transition': {'id': transition_id}}
+        
+        response = self.session.post(url, json=data)
+        response.raise_for_status()
+        # The issue's status changed, so its cached transitions are stale
+        self._transitions_cache.pop(issue_key, None)
+        self._invalidate_cache()
+        return True
+    
+    def add_comment(self, issue_key: str, comment: str) -> bool:
+        """Add comment to issue."""
+        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
+        
+        data = {
+            'body': {
+                'type': 'doc',
+                'version': 1,
+                'content': [
+                    {
+                        'type': 'paragraph',
+                        'content': [
+                            {
+                                'type': 'text',
+                                'text': comment
+                            }
+                        ]
+                    }
+                ]
+            }
+        }
+        
+        response = self.session.post(url, json=data)
+        response.raise_for_status()
+        self._invalidate_cache()
+        return True
+    
+    def _invalidate_cache(self):
+        """Drop cached GET responses so later fetches see our writes."""
+        if self._cached:
+            self.session.cache.clear()
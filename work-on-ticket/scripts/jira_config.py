@@ -2,14 +2,51 @@
 """
 Configuration Manager for Multiple Jira Sites
 
-Reads from .jira-config file to support multiple Jira instances
+Reads from .jira-config file to support multiple Jira instances.
+The file may be TOML or the original INI layout.
 """
 
 import os
-import configparser
-from typing import Dict, Optional
+import functools
+from typing import Dict, Mapping, Optional
 from pathlib import Path
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(path: str, mtime_ns: int) -> Dict[str, Mapping[str, str]]:
+    """Parse a config file into {section: mapping}, cached per (path, mtime)."""
+    if tomllib is not None:
+        try:
+            with open(path, 'rb') as f:
+                data = tomllib.load(f)
+        except tomllib.TOMLDecodeError:
+            pass  # Not TOML; read it as INI below
+        else:
+            # Top-level keys and a [DEFAULT] table both act as defaults
+            defaults = {k: v for k, v in data.items() if not isinstance(v, dict)}
+            defaults.update(data.get('DEFAULT', {}))
+            sections = {'DEFAULT': defaults}
+            for name, values in data.items():
+                if isinstance(values, dict) and name != 'DEFAULT':
+                    sections[name] = {**defaults, **values}
+            return sections
+    
+    import configparser
+    
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    # Keep the section proxies: values are interpolated only when read, so a
+    # stray '%' in one profile does not break the others
+    sections = {'DEFAULT': parser['DEFAULT']}
+    for name in parser.sections():
+        sections[name] = parser[name]
+    return sections
+
 
 class JiraConfig:
     def __init__(self, config_file: Optional[str] = None):
@@ -25,10 +62,10 @@ class JiraConfig:
                 config_file = script_dir / '.jira-config'
         
         self.config_file = Path(config_file)
-        self.config = configparser.ConfigParser()
+        self.config = {}
         
         if self.config_file.exists():
-            self.config.read(self.config_file)
+            self.config = _load_config(str(self.config_file), self.config_file.stat().st_mtime_ns)
         else:
             print(f"⚠️  Config file not found: {self.config_file}")
             print("    Using environment variables instead")
@@ -40,7 +77,7 @@ class JiraConfig:
         if self.config_file.exists():
             if profile_name is None:
                 # Use default profile
-                profile_name = self.config.get('DEFAULT', 'default_profile', fallback='ihkreddy')
+                profile_name = self.config.get('DEFAULT', {}).get('default_profile', 'ihkreddy')
             
             if profile_name in self.config:
                 profile = self.config[profile_name]
@@ -62,7 +99,7 @@ class JiraConfig:
     def list_profiles(self) -> list:
         """List all available profiles."""
         profiles = []
-        for section in self.config.sections():
+        for section in self.config:
             if section != 'DEFAULT':
                 profiles.append(section)
         return profiles
@@ -77,8 +114,12 @@ class JiraConfig:
         return True
 
 
+@functools.lru_cache(maxsize=8)
 def get_config(profile: Optional[str] = None) -> Dict[str, str]:
-    """Convenience function to get Jira configuration."""
+    """Convenience function to get Jira configuration.
+    
+    Resolved once per profile per process; treat the result as read-only.
+    """
     config = JiraConfig()
     credentials = config.get_profile(profile)
     
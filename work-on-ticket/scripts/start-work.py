@@ -18,101 +18,25 @@ import os
 import sys
 import subprocess
 import re
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import requests
-from requests.auth import HTTPBasicAuth
 
-# Import config manager
+# Import Jira client
 sys.path.insert(0, str(Path(__file__).parent))
-from jira_config import get_config
+from jira_client import JiraClient
 
-
-class JiraClient:
-    def __init__(self, profile: Optional[str] = None):
-        # Get credentials from config file or environment
-        credentials = get_config(profile)
-        
-        self.base_url = credentials['url'].rstrip('/')
-        self.email = credentials['email']
-        self.api_token = credentials['token']
-        
-        self.auth = HTTPBasicAuth(self.email, self.api_token)
-        self.session = requests.Session()
-        self.session.auth = self.auth
-        self.session.headers.update({
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        })
-    
-    def get_issue(self, issue_key: str):
-        """Fetch issue details."""
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
-    
-    def get_transitions(self, issue_key: str):
-        """Get available transitions."""
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json().get('transitions', [])
-    
-    def transition_issue(self, issue_key: str, transition_name: str):
-        """Transition issue to new status."""
-        transitions = self.get_transitions(issue_key)
-        
-        transition_id = None
-        for trans in transitions:
-            if trans['name'].lower() == transition_name.lower():
-                transition_id = trans['id']
-                break
-        
-        if not transition_id:
-            print(f"⚠️  Transition '{transition_name}' not available")
-            return False
-        
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
-        data = {'transition': {'id': transition_id}}
-        
-        response = self.session.post(url, json=data)
-        response.raise_for_status()
-        return True
-    
-    def add_comment(self, issue_key: str, comment: str):
-        """Add comment to issue."""
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
-        
-        data = {
-            'body': {
-                'type': 'doc',
-                'version': 1,
-                'content': [
-                    {
-                        'type': 'paragraph',
-                        'content': [
-                            {
-                                'type': 'text',
-                                'text': comment
-                            }
-                        ]
-                    }
-                ]
-            }
-        }
-        
-        response = self.session.post(url, json=data)
-        response.raise_for_status()
-        return True
+# Branch-name slug patterns, compiled once
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
 
 
 def slugify(text: str) -> str:
     """Convert text to slug format for branch names."""
     # Remove special characters
-    text = re.sub(r'[^\w\s-]', '', text.lower())
+    text = _SLUG_STRIP.sub('', text.lower())
     # Replace spaces with hyphens
-    text = re.sub(r'[-\s]+', '-', text)
+    text = _SLUG_DASH.sub('-', text)
     # Trim hyphens from ends
     text = text.strip('-')
     # Limit length
@@ -126,15 +50,14 @@ def create_branch(ticket_key: str, summary: str, branch_type: str = 'feature') -
     branch_name = f"{branch_type}/{ticket_key.lower()}-{slug}"
     
     try:
-        # Check if we're in a git repo
-        subprocess.run(['git', 'rev-parse', '--git-dir'], 
-                      check=True, capture_output=True)
+        # One call answers both "are we in a git repo" and "does the branch
+        # exist": 0 = exists, 1 = missing, anything else = git error
+        cmd = ['git', 'show-ref', '--verify', '--quiet', f'refs/heads/{branch_name}']
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode not in (0, 1):
+            raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
         
-        # Check if branch already exists
-        result = subprocess.run(['git', 'branch', '--list', branch_name],
-                              capture_output=True, text=True)
-        
-        if result.stdout.strip():
+        if result.returncode == 0:
             print(f"⚠️  Branch '{branch_name}' already exists")
             # Checkout existing branch
             subprocess.run(['git', 'checkout', branch_name], check=True)
@@ -184,17 +107,21 @@ def display_ticket_info(issue_data: dict):
 
 def extract_text_from_adf(adf: dict) -> str:
     """Extract text from Atlassian Document Format."""
+    # Walk the tree with an explicit stack; children are pushed reversed
+    # so text comes out in document order
     text_parts = []
-    
-    def extract(node):
+    append = text_parts.append
+    stack = deque([adf])
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
             if node.get('type') == 'text':
-                text_parts.append(node.get('text', ''))
+                append(node.get('text', ''))
             elif 'content' in node:
-                for child in node['content']:
-                    extract(child)
+                stack.extend(reversed(node['content']))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
     
-    extract(adf)
     return ' '.join(text_parts)
 
 
@@ -222,7 +149,9 @@ def main():
     parser.add_argument('--no-status-update', action='store_true', 
                        help='Skip updating ticket status')
     parser.add_argument('--no-comment', action='store_true',
+                       help='Skip adding a comment to the ticket')
     parser.add_argument('--profile', '-p', help='Jira profile to use (from .jira-config)')
+    parser.add_argument('--no-cache', action='store_true', help='Clear the local response cache and fetch fresh data')
     
     args = parser.parse_args()
     
@@ -232,8 +161,7 @@ def main():
     
     # Initialize Jira client
     try:
-        client = JiraClient(args.profile
-        client = JiraClient()
+        client = JiraClient(args.profile, use_cache=not args.no_cache)
     except Exception as e:
         print(f"❌ Failed to initialize Jira client: {e}")
         sys.exit(1)
@@ -263,26 +191,37 @@ def main():
         print("❌ Failed to create branch")
         sys.exit(1)
     
-    # Update ticket status
-    if not args.no_status_update:
-        try:
+    # Status update and comment are independent writes, so send them
+    # concurrently; transitions were already returned with the issue
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = None
+        if not args.no_status_update:
             print(f"🔄 Updating ticket status...")
-            if client.transition_issue(args.ticket, 'In Progress'):
-                print(f"✓ Updated status to 'In Progress'")
-            else:
-                print(f"⚠️  Could not update status (may already be in progress)")
-        except Exception as e:
-            print(f"⚠️  Status update failed: {e}")
-    
-    # Add comment
-    if not args.no_comment:
-        try:
+            status_future = executor.submit(client.transition_issue, args.ticket, 'In Progress')
+        
+        comment_future = None
+        if not args.no_comment:
             print(f"💬 Adding comment to ticket...")
             comment = f"Started working on this ticket in branch: {branch_name}"
-            client.add_comment(args.ticket, comment)
-            print(f"✓ Added comment")
-        except Exception as e:
-            print(f"⚠️  Failed to add comment: {e}")
+            comment_future = executor.submit(client.add_comment, args.ticket, comment)
+        
+        # Update ticket status
+        if status_future is not None:
+            try:
+                if status_future.result():
+                    print(f"✓ Updated status to 'In Progress'")
+                else:
+                    print(f"⚠️  Could not update status (may already be in progress)")
+            except Exception as e:
+                print(f"⚠️  Status update failed: {e}")
+        
+        # Add comment
+        if comment_future is not None:
+            try:
+                comment_future.result()
+                print(f"✓ Added comment")
+            except Exception as e:
+                print(f"⚠️  Failed to add comment: {e}")
     
     # Success summary
     print(f"\n{'='*60}")
@@ -1,87 +1,154 @@
 #!/usr/bin/env python3
 """Quick test to verify Jira connection"""
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 from jira_config import get_config
 
-# Get credentials from project config
-config = get_config()
-base_url = config['url']
-email = config['email']
-api_token = config['token']
 
-auth = HTTPBasicAuth(email, api_token)
+def probe_myself(session, base_url):
+    """Test 1: Check myself endpoint (simplest test)."""
+    response = session.get(f"{base_url}/rest/api/3/myself")
+    response.raise_for_status()
+    return response.json()
 
-print(f"Testing connection to: {base_url}")
-print(f"Using email: {email}\n")
 
-# Test 1: Check myself endpoint (simplest test)
-print("Test 1: Authenticating...")
-try:
-    url = f"{base_url}/rest/api/3/myself"
-    response = requests.get(url, auth=auth)
-    response.raise_for_status()
-    user_data = response.json()
-    print(f"✓ Authentication successful!")
-    print(f"  User: {user_data.get('displayName')}")
-    print(f"  Account ID: {user_data.get('accountId')}\n")
-except Exception as e:
-    print(f"❌ Authentication failed: {e}\n")
-    exit(1)
-
-# Test 2: List projects
-print("Test 2: Fetching projects...")
-try:
-    url = f"{base_url}/rest/api/3/project"
-    response = requests.get(url, auth=auth)
+def probe_projects(session, base_url):
+    """Test 2: List projects."""
+    response = session.get(f"{base_url}/rest/api/3/project")
     response.raise_for_status()
-    projects = response.json()
-    
-    if projects:
-        print(f"✓ Found {len(projects)} project(s):")
-        for proj in projects:
-            print(f"  - {proj['key']}: {proj['name']}")
-        print()
-    else:
-        print("⚠️  No projects found\n")
-except Exception as e:
-    print(f"❌ Error fetching projects: {e}\n")
+    return response.json()
+
 
-# Test 3: Search for issues
-print("Test 3: Searching for recent issues...")
-try:
-    url = f"{base_url}/rest/api/3/search"
+def probe_search(session, base_url):
+    """Test 3: Search for issues."""
     params = {
         'jql': 'order by created DESC',
         'maxResults': 5,
         'fields': 'summary,status,issuetype,key'
     }
-    response = requests.get(url, auth=auth, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✓ Search successful! Found {data['total']} total issue(s)")
-        
-        if data['issues']:
-            print("\nRecent issues:")
-            for issue in data['issues']:
-                key = issue['key']
-                summary = issue['fields']['summary']
-                status = issue['fields']['status']['name']
-                issue_type = issue['fields']['issuetype']['name']
-                print(f"  [{key}] {summary}")
-                print(f"      Type: {issue_type}, Status: {status}")
-        else:
-            print("\nNo issues found. Create your first ticket in Jira!")
+    response = session.get(f"{base_url}/rest/api/3/search", params=params)
+    # A non-200 status is reported, not raised: it usually means an empty Jira
+    if response.status_code != 200:
+        return response.status_code, None
+    return response.status_code, response.json()
+
+
+# Probes run concurrently once authentication has succeeded
+PROBES = {
+    'projects': probe_projects,
+    'search': probe_search,
+}
+
+
+def run_probe(label, probe, session, base_url):
+    """Run one probe, returning (label, ok, payload_or_exception)."""
+    try:
+        return label, True, probe(session, base_url)
+    except Exception as e:
+        return label, False, e
+
+
+def print_myself(ok, payload):
+    print("Test 1: Authenticating...")
+    if not ok:
+        print(f"❌ Authentication failed: {payload}\n")
+        return False
+    print(f"✓ Authentication successful!")
+    print(f"  User: {payload.get('displayName')}")
+    print(f"  Account ID: {payload.get('accountId')}\n")
+    return True
+
+
+def print_projects(ok, payload):
+    print("Test 2: Fetching projects...")
+    if not ok:
+        print(f"❌ Error fetching projects: {payload}\n")
+        return
+    if payload:
+        print(f"✓ Found {len(payload)} project(s):")
+        for proj in payload:
+            print(f"  - {proj['key']}: {proj['name']}")
+        print()
     else:
-        print(f"⚠️  Search returned status {response.status_code}")
-        print(f"    This might mean no issues exist yet")
-        
-except Exception as e:
-    print(f"ℹ️  Could not search issues: {e}")
-    print("    This is OK if your Jira is empty")
-
-print("\n" + "="*60)
-print("✅ Connection test complete!")
-print("="*60)
+        print("⚠️  No projects found\n")
+
+
+def print_search(ok, payload):
+    print("Test 3: Searching for recent issues...")
+    try:
+        if not ok:
+            raise payload
+        status_code, data = payload
+
+        if status_code == 200:
+            print(f"✓ Search successful! Found {data['total']} total issue(s)")
+
+            if data['issues']:
+                print("\nRecent issues:")
+                for issue in data['issues']:
+                    key = issue['key']
+                    summary = issue['fields']['summary']
+                    status = issue['fields']['status']['name']
+                    issue_type = issue['fields']['issuetype']['name']
+                    print(f"  [{key}] {summary}")
+                    print(f"      Type: {issue_type}, Status: {status}")
+            else:
+                print("\nNo issues found. Create your first ticket in Jira!")
+        else:
+            print(f"⚠️  Search returned status {status_code}")
+            print(f"    This might mean no issues exist yet")
+
+    except Exception as e:
+        print(f"ℹ️  Could not search issues: {e}")
+        print("    This is OK if your Jira is empty")
+
+
+def main():
+    # Get credentials from project config
+    config = get_config()
+    base_url = config['url']
+    email = config['email']
+    api_token = config['token']
+
+    # One session for all probes so they share keep-alive connections
+    session = requests.Session()
+    session.auth = HTTPBasicAuth(email, api_token)
+    session.headers.update({'Accept': 'application/json'})
+    session.mount(f"{urlsplit(base_url).scheme}://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+    print(f"Testing connection to: {base_url}")
+    print(f"Using email: {email}\n")
+
+    with session:
+        # Authenticate first: with bad credentials there is no point in
+        # sending the other probes
+        _, ok, payload = run_probe('myself', probe_myself, session, base_url)
+        if not print_myself(ok, payload):
+            exit(1)
+
+        # The remaining probes are independent, so run them concurrently
+        # and print in order
+        with ThreadPoolExecutor(max_workers=len(PROBES)) as executor:
+            futures = [
+                executor.submit(run_probe, label, probe, session, base_url)
+                for label, probe in PROBES.items()
+            ]
+            results = {}
+            for future in as_completed(futures):
+                label, ok, payload = future.result()
+                results[label] = (ok, payload)
+
+    print_projects(*results['projects'])
+    print_search(*results['search'])
+
+    print("\n" + "="*60)
+    print("✅ Connection test complete!")
+    print("="*60)
+
+
+if __name__ == '__main__':
+    main()